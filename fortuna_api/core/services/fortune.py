@@ -120,6 +120,25 @@ class FortuneService:
         FiveElements.WATER: "water.png"
     }
 
+    # Element (Korean name) to color description mapping
+    ELEMENT_TO_COLOR = {
+        "목": "초록색, 청색",
+        "화": "빨간색, 주황색",
+        "토": "노란색, 갈색",
+        "금": "흰색, 회색",
+        "수": "검은색, 파란색"
+    }
+
+    # 육합 (Six Harmonies): 지지끼리의 조화, stored order-independently
+    LIU_HE_PAIRS = frozenset({
+        frozenset((TwelveBranches.JA, TwelveBranches.CHUK)),   # 자축합
+        frozenset((TwelveBranches.IN, TwelveBranches.HAE)),    # 인해합
+        frozenset((TwelveBranches.MYO, TwelveBranches.SUL)),   # 묘술합
+        frozenset((TwelveBranches.JIN, TwelveBranches.YU)),    # 진유합
+        frozenset((TwelveBranches.SA, TwelveBranches.SIN)),    # 사신합
+        frozenset((TwelveBranches.O, TwelveBranches.MI)),      # 오미합
+    })
+
     # Cache for uploaded character file IDs (class variable)
     _character_file_cache: Dict[str, str] = {}
 
@@ -225,6 +244,23 @@ class FortuneService:
 
         return Saju._calculate_day_pillar(date_value)
 
+    def calculate_day_ganji_range(self, start_date: datetime, days: int) -> List[GanJi]:
+        """
+        Calculate day pillars (일주) for consecutive days in one pass.
+
+        Args:
+            start_date: First date of the range
+            days: Number of consecutive days
+
+        Returns:
+            List of GanJi objects, one per day starting at start_date
+        """
+        start_ordinal = start_date.toordinal()
+        return [
+            Saju._calculate_day_pillar_from_ordinal(start_ordinal + offset)
+            for offset in range(days)
+        ]
+
     def get_user_saju_info(self, user_id: int) -> Saju:
         """
         Get user's Saju information from database.
@@ -242,16 +278,33 @@ class FortuneService:
 
         try:
             user = User.objects.get(id=user_id)
+        except User.DoesNotExist:
+            raise ValueError(f"User {user_id} not found")
 
-            # Validate that user has complete saju data
-            if not all([user.yearly_ganji, user.monthly_ganji, user.daily_ganji, user.hourly_ganji]):
-                raise ValueError(f"User {user_id} has incomplete saju data")
+        return self.get_saju_for_user(user)
 
-            # Build Saju object from user's ganji data using user.saju() method
-            return user.saju()
+    def get_saju_for_user(self, user: User) -> Saju:
+        """
+        Get Saju information from an already loaded user.
 
-        except User.DoesNotExist:
-            raise ValueError(f"User {user_id} not found")
+        Use this instead of get_user_saju_info when the caller holds the
+        User instance, to avoid fetching the same row again.
+
+        Args:
+            user: User instance
+
+        Returns:
+            Saju object containing user's four pillars
+
+        Raises:
+            ValueError: If saju data incomplete
+        """
+        # Validate that user has complete saju data
+        if not all([user.yearly_ganji, user.monthly_ganji, user.daily_ganji, user.hourly_ganji]):
+            raise ValueError(f"User {user.id} has incomplete saju data")
+
+        # Build Saju object from user's ganji data using user.saju() method
+        return user.saju()
 
     def analyze_saju_compatibility(
         self,
@@ -360,22 +413,7 @@ class FortuneService:
         Returns:
             True if combination is beneficial
         """
-        # 육합 (Six Harmonies): 지지끼리의 조화
-        liu_he_pairs = [
-            (TwelveBranches.JA, TwelveBranches.CHUK),   # 자축합
-            (TwelveBranches.IN, TwelveBranches.HAE),    # 인해합
-            (TwelveBranches.MYO, TwelveBranches.SUL),   # 묘술합
-            (TwelveBranches.JIN, TwelveBranches.YU),    # 진유합
-            (TwelveBranches.SA, TwelveBranches.SIN),    # 사신합
-            (TwelveBranches.O, TwelveBranches.MI),      # 오미합
-        ]
-
-        for branch_a, branch_b in liu_he_pairs:
-            if (user_branch == branch_a and tomorrow_branch == branch_b) or \
-               (user_branch == branch_b and tomorrow_branch == branch_a):
-                return True
-
-        return False
+        return frozenset((user_branch, tomorrow_branch)) in self.LIU_HE_PAIRS
 
     def prepare_photo_context(
         self,
@@ -718,14 +756,7 @@ class FortuneService:
 
     def _get_element_color(self, element: str) -> str:
         """Get color representation for an element."""
-        element_colors = {
-            "목": "초록색, 청색",
-            "화": "빨간색, 주황색",
-            "토": "노란색, 갈색",
-            "금": "흰색, 회색",
-            "수": "검은색, 파란색"
-        }
-        return element_colors.get(element, "무지개색")
+        return self.ELEMENT_TO_COLOR.get(element, "무지개색")
 
     ### public methods ###
 
@@ -793,7 +824,7 @@ class FortuneService:
 
                 except FortuneResult.DoesNotExist:
                     # Create placeholder record with 'processing' status (atomic)
-                    user_saju = self.get_user_saju_info(user.id)
+                    user_saju = self.get_saju_for_user(user)
                     tomorrow_day_ganji = self.calculate_day_ganji(tomorrow_date)
                     fortune_score = self.calculate_fortune_balance(user, tomorrow_date)
 
@@ -23,12 +23,24 @@ logger = logging.getLogger(__name__)
 class ImageService:
     """Service for handling image uploads and metadata extraction."""
 
-    @staticmethod
-    def _get_s3_client():
+    # (settings key, boto3 client) reused across calls; rebuilt if S3 settings change
+    _cached_s3_client: Optional[tuple] = None
+
+    @classmethod
+    def _get_s3_client(cls):
         """Get configured S3 client for presigned URL generation."""
         if not getattr(settings, 'USE_S3', False):
             return None
 
+        key = (
+            settings.AWS_ACCESS_KEY_ID,
+            settings.AWS_SECRET_ACCESS_KEY,
+            getattr(settings, 'AWS_S3_ENDPOINT_URL', None),
+            settings.AWS_S3_REGION_NAME,
+        )
+        if cls._cached_s3_client is not None and cls._cached_s3_client[0] == key:
+            return cls._cached_s3_client[1]
+
         from botocore.config import Config
 
         # Configure boto3 with timeouts to prevent hanging
@@ -38,14 +50,16 @@ class ImageService:
             retries={'max_attempts': 1}
         )
 
-        return boto3.client(
+        client = boto3.client(
             's3',
-            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-            endpoint_url=getattr(settings, 'AWS_S3_ENDPOINT_URL', None),
-            region_name=settings.AWS_S3_REGION_NAME,
+            aws_access_key_id=key[0],
+            aws_secret_access_key=key[1],
+            endpoint_url=key[2],
+            region_name=key[3],
             config=config
         )
+        cls._cached_s3_client = (key, client)
+        return client
 
     @staticmethod
     def generate_upload_presigned_url(user_id: int, chakra_type: str = 'default') -> Dict[str, Any]:
@@ -357,17 +371,21 @@ class ImageService:
         Returns:
             List of image data for the specified date
         """
-        # Query images from database
+        # Query images from database, loading only the columns used below
         images = ChakraImage.objects.filter(
             user_id=user_id,
             date=date.date()
+        ).only(
+            'id', 'image', 'chakra_type', 'timestamp', 'latitude', 'longitude'
         ).order_by('-timestamp')
 
+        use_presigned = generate_presigned and getattr(settings, 'USE_S3', False)
+
         result = []
         for img in images:
             # Extract S3 key from image field if using S3
             image_url = img.image.url
-            if generate_presigned and getattr(settings, 'USE_S3', False):
+            if use_presigned:
                 # Extract key from image field name
                 image_key = img.image.name
                 presigned_url = ImageService.generate_view_presigned_url(image_key)
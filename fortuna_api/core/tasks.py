@@ -180,7 +180,7 @@ def generate_fortune_sync(user_id: int, date_str: str, generate_image: bool = Tr
             return
 
         # Generate fortune with AI (all sync operations in worker thread)
-        user_saju = fortune_service.get_user_saju_info(user_id)
+        user_saju = fortune_service.get_saju_for_user(user)
         tomorrow_day_ganji = fortune_service.calculate_day_ganji(date)
         fortune_score = fortune_service.calculate_fortune_balance(user, date)
 
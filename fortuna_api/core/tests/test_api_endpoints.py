@@ -20,6 +20,34 @@ from rest_framework_simplejwt.tokens import RefreshToken
 User = get_user_model()
 
 
+def _encode_jpeg(size, color):
+    """Encode a solid-colour RGB image as JPEG bytes."""
+    img_io = BytesIO()
+    Image.new('RGB', size, color=color).save(img_io, format='JPEG')
+    return img_io.getvalue()
+
+
+# Encoded once and shared; SimpleUploadedFile never mutates the bytes
+_TEST_JPEG = _encode_jpeg((100, 100), 'red')
+
+
+def _create_poc_chakras(user, chakra_type, date, timestamp, count=1):
+    """Insert ``count`` PoC-collected chakras for one user and date in a single query."""
+    from core.models import ChakraImage
+    return ChakraImage.objects.bulk_create([
+        ChakraImage(
+            user=user,
+            image=None,
+            chakra_type=chakra_type,
+            date=date,
+            timestamp=timestamp,
+            device_make='PoC',
+            device_model='PoC'
+        )
+        for _ in range(count)
+    ])
+
+
 class TestImageAPIEndpoints(APITestCase):
     """Test cases for image-related API endpoints."""
 
@@ -46,13 +74,9 @@ class TestImageAPIEndpoints(APITestCase):
 
     def create_test_image(self):
         """Create a test image file."""
-        image = Image.new('RGB', (100, 100), color='red')
-        img_io = BytesIO()
-        image.save(img_io, format='JPEG')
-        img_io.seek(0)
         return SimpleUploadedFile(
             name='test.jpg',
-            content=img_io.read(),
+            content=_TEST_JPEG,
             content_type='image/jpeg'
         )
 
@@ -368,38 +392,12 @@ class TestImageAPIEndpoints(APITestCase):
 
     def test_get_collection_status_success(self):
         """Test getting chakra collection status."""
-        from core.models import ChakraImage
         from django.utils import timezone
 
         # Create some test chakra images
         now = timezone.now()
-        ChakraImage.objects.create(
-            user=self.user,
-            image=None,
-            chakra_type='fire',
-            date=now.date(),
-            timestamp=now,
-            device_make='PoC',
-            device_model='PoC'
-        )
-        ChakraImage.objects.create(
-            user=self.user,
-            image=None,
-            chakra_type='fire',
-            date=now.date(),
-            timestamp=now,
-            device_make='PoC',
-            device_model='PoC'
-        )
-        ChakraImage.objects.create(
-            user=self.user,
-            image=None,
-            chakra_type='water',
-            date=now.date(),
-            timestamp=now,
-            device_make='PoC',
-            device_model='PoC'
-        )
+        _create_poc_chakras(self.user, 'fire', now.date(), now, count=2)
+        _create_poc_chakras(self.user, 'water', now.date(), now)
 
         url = reverse('core:chakra_collection_status')
         response = self.client.get(url)
@@ -467,7 +465,7 @@ class TestImageAPIEndpoints(APITestCase):
 
     def test_today_progress_with_collected_chakras(self):
         """Test today's progress with some collected chakras."""
-        from core.models import FortuneResult, ChakraImage
+        from core.models import FortuneResult
         from django.utils import timezone
 
         today = timezone.now().date()
@@ -491,27 +489,10 @@ class TestImageAPIEndpoints(APITestCase):
         )
 
         # Collect 3 fire chakras
-        for _ in range(3):
-            ChakraImage.objects.create(
-                user=self.user,
-                image=None,
-                chakra_type='fire',
-                date=today,
-                timestamp=now,
-                device_make='PoC',
-                device_model='PoC'
-            )
+        _create_poc_chakras(self.user, 'fire', today, now, count=3)
 
         # Collect 1 water chakra (wrong element)
-        ChakraImage.objects.create(
-            user=self.user,
-            image=None,
-            chakra_type='water',
-            date=today,
-            timestamp=now,
-            device_make='PoC',
-            device_model='PoC'
-        )
+        _create_poc_chakras(self.user, 'water', today, now)
 
         url = reverse('core:chakra-today-progress')
         response = self.client.get(url)
@@ -526,7 +507,7 @@ class TestImageAPIEndpoints(APITestCase):
 
     def test_today_progress_completed(self):
         """Test today's progress when target is achieved."""
-        from core.models import FortuneResult, ChakraImage
+        from core.models import FortuneResult
         from django.utils import timezone
 
         today = timezone.now().date()
@@ -550,16 +531,7 @@ class TestImageAPIEndpoints(APITestCase):
         )
 
         # Collect 7 water chakras (exceeds target of 5)
-        for _ in range(7):
-            ChakraImage.objects.create(
-                user=self.user,
-                image=None,
-                chakra_type='water',
-                date=today,
-                timestamp=now,
-                device_make='PoC',
-                device_model='PoC'
-            )
+        _create_poc_chakras(self.user, 'water', today, now, count=7)
 
         url = reverse('core:chakra-today-progress')
         response = self.client.get(url)
@@ -614,7 +586,7 @@ class TestImageAPIEndpoints(APITestCase):
 
     def test_today_progress_with_date_parameter(self):
         """Test today's progress with specific date parameter."""
-        from core.models import FortuneResult, ChakraImage
+        from core.models import FortuneResult
         from django.utils import timezone
 
         # Create FortuneResult for a specific date (Dec 4, 2025)
@@ -637,16 +609,7 @@ class TestImageAPIEndpoints(APITestCase):
         )
 
         # Create some ChakraImages for that date
-        for _ in range(3):
-            ChakraImage.objects.create(
-                user=self.user,
-                image=None,
-                chakra_type='fire',
-                date=target_date,
-                timestamp=timezone.now(),
-                device_make='PoC',
-                device_model='PoC'
-            )
+        _create_poc_chakras(self.user, 'fire', target_date, timezone.now(), count=3)
 
         url = reverse('core:chakra-today-progress')
         response = self.client.get(url, {'date': '2025-12-04'})
@@ -677,34 +640,15 @@ class TestImageAPIEndpoints(APITestCase):
 
     def test_collection_status_with_date_parameter(self):
         """Test collection status with specific date filter."""
-        from core.models import ChakraImage
         from django.utils import timezone
 
         # Create chakras on different dates
         date1 = datetime(2025, 12, 4).date()
         date2 = datetime(2025, 12, 5).date()
 
-        for _ in range(2):
-            ChakraImage.objects.create(
-                user=self.user,
-                image=None,
-                chakra_type='fire',
-                date=date1,
-                timestamp=timezone.now(),
-                device_make='PoC',
-                device_model='PoC'
-            )
+        _create_poc_chakras(self.user, 'fire', date1, timezone.now(), count=2)
 
-        for _ in range(3):
-            ChakraImage.objects.create(
-                user=self.user,
-                image=None,
-                chakra_type='water',
-                date=date2,
-                timestamp=timezone.now(),
-                device_make='PoC',
-                device_model='PoC'
-            )
+        _create_poc_chakras(self.user, 'water', date2, timezone.now(), count=3)
 
         # Test without date filter (should return all 5)
         url = reverse('core:chakra_collection_status')
@@ -721,7 +665,7 @@ class TestImageAPIEndpoints(APITestCase):
 
     def test_monthly_history_success(self):
         """Test getting monthly history with multiple days."""
-        from core.models import FortuneResult, ChakraImage
+        from core.models import FortuneResult
         from django.utils import timezone
 
         # Create fortune results for September 2025
@@ -749,16 +693,7 @@ class TestImageAPIEndpoints(APITestCase):
 
             # Collect some chakras
             element_en = {'목': 'wood', '화': 'fire', '토': 'earth', '금': 'metal', '수': 'water'}[element]
-            for _ in range(day):  # day 1: 1개, day 2: 2개, ...
-                ChakraImage.objects.create(
-                    user=self.user,
-                    image=None,
-                    chakra_type=element_en,
-                    date=date,
-                    timestamp=timezone.now(),
-                    device_make='PoC',
-                    device_model='PoC'
-                )
+            _create_poc_chakras(self.user, element_en, date, timezone.now(), count=day)  # day 1: 1개, day 2: 2개, ...
 
         url = reverse('core:chakra_monthly_history')
         response = self.client.get(url, {'month': '2025-09'})
@@ -820,7 +755,6 @@ class TestImageAPIEndpoints(APITestCase):
 
     def test_element_focused_history_success(self):
         """Test getting element-focused history with multiple dates."""
-        from core.models import ChakraImage
         from django.utils import timezone
 
         # Create chakra images for wood element on different dates
@@ -833,16 +767,7 @@ class TestImageAPIEndpoints(APITestCase):
         for date in dates:
             # Create multiple chakras on each date
             count = dates.index(date) + 2  # 2, 3, 4 chakras
-            for _ in range(count):
-                ChakraImage.objects.create(
-                    user=self.user,
-                    image=None,
-                    chakra_type='wood',
-                    date=date,
-                    timestamp=timezone.now(),
-                    device_make='PoC',
-                    device_model='PoC'
-                )
+            _create_poc_chakras(self.user, 'wood', date, timezone.now(), count=count)
 
         url = reverse('core:chakra_element_history')
         response = self.client.get(url, {'element': 'wood'})
@@ -878,8 +803,8 @@ class TestImageAPIEndpoints(APITestCase):
         }
 
         # Create one chakra for each element type
-        for element_en, element_kr in element_types.items():
-            ChakraImage.objects.create(
+        ChakraImage.objects.bulk_create([
+            ChakraImage(
                 user=self.user,
                 image=None,
                 chakra_type=element_en,
@@ -888,6 +813,8 @@ class TestImageAPIEndpoints(APITestCase):
                 device_make='PoC',
                 device_model='PoC'
             )
+            for element_en in element_types
+        ])
 
         # Test each element type
         for element_en, element_kr in element_types.items():
@@ -958,22 +885,12 @@ class TestImageAPIEndpoints(APITestCase):
 
     def test_element_focused_history_multiple_counts_same_date(self):
         """Test element-focused history when multiple chakras collected on same date."""
-        from core.models import ChakraImage
         from django.utils import timezone
 
         date = datetime(2025, 11, 20).date()
 
         # Create 8 metal chakras on the same date
-        for _ in range(8):
-            ChakraImage.objects.create(
-                user=self.user,
-                image=None,
-                chakra_type='metal',
-                date=date,
-                timestamp=timezone.now(),
-                device_make='PoC',
-                device_model='PoC'
-            )
+        _create_poc_chakras(self.user, 'metal', date, timezone.now(), count=8)
 
         url = reverse('core:chakra_element_history')
         response = self.client.get(url, {'element': 'metal'})
@@ -986,7 +903,6 @@ class TestImageAPIEndpoints(APITestCase):
 
     def test_element_focused_history_multiple_users(self):
         """Test element-focused history only returns current user's data."""
-        from core.models import ChakraImage
         from django.utils import timezone
 
         # Create another user
@@ -998,28 +914,10 @@ class TestImageAPIEndpoints(APITestCase):
         date = timezone.now().date()
 
         # Create chakras for current user
-        for _ in range(3):
-            ChakraImage.objects.create(
-                user=self.user,
-                image=None,
-                chakra_type='earth',
-                date=date,
-                timestamp=timezone.now(),
-                device_make='PoC',
-                device_model='PoC'
-            )
+        _create_poc_chakras(self.user, 'earth', date, timezone.now(), count=3)
 
         # Create chakras for other user (should not be included)
-        for _ in range(5):
-            ChakraImage.objects.create(
-                user=other_user,
-                image=None,
-                chakra_type='earth',
-                date=date,
-                timestamp=timezone.now(),
-                device_make='PoC',
-                device_model='PoC'
-            )
+        _create_poc_chakras(other_user, 'earth', date, timezone.now(), count=5)
 
         url = reverse('core:chakra_element_history')
         response = self.client.get(url, {'element': 'earth'})
@@ -1040,8 +938,8 @@ class TestImageAPIEndpoints(APITestCase):
             datetime(2025, 12, 1).date(),
         ]
 
-        for date in dates:
-            ChakraImage.objects.create(
+        ChakraImage.objects.bulk_create([
+            ChakraImage(
                 user=self.user,
                 image=None,
                 chakra_type='fire',
@@ -1050,6 +948,8 @@ class TestImageAPIEndpoints(APITestCase):
                 device_make='PoC',
                 device_model='PoC'
             )
+            for date in dates
+        ])
 
         url = reverse('core:chakra_element_history')
         response = self.client.get(url, {'element': 'fire'})
@@ -1357,13 +1257,9 @@ class TestAPIIntegration(APITestCase):
 
     def create_test_image(self):
         """Helper method to create test image."""
-        image = Image.new('RGB', (100, 100), color='blue')
-        img_io = BytesIO()
-        image.save(img_io, format='JPEG')
-        img_io.seek(0)
         return SimpleUploadedFile(
             'test.jpg',
-            img_io.read(),
+            _TEST_JPEG,
             content_type='image/jpeg'
         )
 
@@ -2,35 +2,208 @@
 Unit tests for FortuneService.
 """
 
-from datetime import datetime, timedelta
-from unittest.mock import Mock, patch, MagicMock
-from django.test import TestCase
+from datetime import date, datetime, timedelta
+from types import MappingProxyType, SimpleNamespace
+from unittest.mock import DEFAULT, Mock, patch, MagicMock
+from django.contrib.auth import get_user_model
+from django.test import SimpleTestCase, TestCase
 import json
 import base64
+import socket
+from ..models import FortuneResult
+from ..services import fortune as fortune_module
 from ..services.fortune import (
     FortuneService,
-    FortuneAIResponse
+    FortuneAIResponse,
+    FortuneScore,
+    ElementDistribution
 )
+from ..utils.saju_concepts import GanJi, Saju
 
+User = get_user_model()
 
-class TestFortuneService(TestCase):
-    """Test cases for FortuneService."""
+def _refuse_network(*args, **kwargs):
+    raise RuntimeError("Network access is disabled in fortune service tests")
+
+
+_module_patchers = [
+    patch.object(fortune_module, 'openai'),
+    # Fail fast if a code path slips past the AI client mocks
+    patch.object(socket.socket, 'connect', _refuse_network),
+    patch.object(socket, 'getaddrinfo', _refuse_network),
+]
+
+
+def setUpModule():
+    """Patch OpenAI and block outbound network once for every test in this module."""
+    for patcher in _module_patchers:
+        patcher.start()
+
+
+def tearDownModule():
+    for patcher in reversed(_module_patchers):
+        patcher.stop()
+
+
+# Reference date for every test; fortunes are generated for the next day
+_TEST_DATE = datetime(2024, 1, 1, 12, 0, 0)
+_TOMORROW = _TEST_DATE + timedelta(days=1)
+
+# 1x1 PNG returned by the mocked Gemini image model
+_TINY_PNG = b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x01\x00\x00\x00\x01\x08\x06\x00\x00\x00\x1f\x15\xc4\x89\x00\x00\x00\rIDATx\x9cc\x00\x01\x00\x00\x05\x00\x01\r\n-\xb4\x00\x00\x00\x00IEND\xaeB`\x82'
+
+_PHOTOS_TWO = (
+    {
+        'filename': 'photo1.jpg',
+        'url': '/media/photo1.jpg',
+        'path': '/path/to/photo1.jpg'
+    },
+    {
+        'filename': 'photo2.jpg',
+        'url': '/media/photo2.jpg',
+        'path': '/path/to/photo2.jpg'
+    },
+)
+
+
+# Fields shared by every compatibility fixture (무신 user, 갑자 tomorrow)
+_COMPATIBILITY_BASE = MappingProxyType({
+    "user_element": "토",
+    "user_element_color": "노란",
+    "tomorrow_element": "목",
+    "tomorrow_element_color": "푸른",
+    "user_ganji": "무신",
+    "tomorrow_ganji": "갑자",
+})
+
+_BALANCED_DISTRIBUTION = {
+    "목": ElementDistribution(count=3, percentage=20.0),
+    "화": ElementDistribution(count=3, percentage=20.0),
+    "토": ElementDistribution(count=3, percentage=20.0),
+    "금": ElementDistribution(count=3, percentage=20.0),
+    "수": ElementDistribution(count=3, percentage=20.0)
+}
+_WATER_POOR_DISTRIBUTION = {
+    "목": ElementDistribution(count=3, percentage=20.0),
+    "화": ElementDistribution(count=3, percentage=20.0),
+    "토": ElementDistribution(count=4, percentage=26.7),
+    "금": ElementDistribution(count=3, percentage=20.0),
+    "수": ElementDistribution(count=2, percentage=13.3)
+}
+
+
+def _make_fortune_score(entropy_score=50.0, needed_element="목", distribution=_BALANCED_DISTRIBUTION):
+    """Build a FortuneScore for 갑자/병인/무신 fortune pillars."""
+    return FortuneScore(
+        entropy_score=entropy_score,
+        elements={
+            "대운": None,
+            "세운": {"two_letters": "갑자"},
+            "월운": {"two_letters": "병인"},
+            "일운": {"two_letters": "무신"},
+            "년주": None,
+            "월주": None,
+            "일주": None,
+            "시주": None,
+        },
+        element_distribution=distribution,
+        interpretation="Test interpretation",
+        needed_element=needed_element
+    )
+
+
+def _fake_openai_response(parsed):
+    """Build a plain-attribute stand-in for an OpenAI parse() response."""
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(parsed=parsed))])
+
+
+def make_gemini_response(image_bytes=None):
+    """Build a plain-attribute Gemini generate_content() response.
+
+    With no ``image_bytes`` the response carries no candidates.
+    """
+    if image_bytes is None:
+        return SimpleNamespace(candidates=[])
+    part = SimpleNamespace(inline_data=SimpleNamespace(data=image_bytes))
+    return SimpleNamespace(candidates=[SimpleNamespace(content=SimpleNamespace(parts=[part]))])
+
+
+def configure_gemini_mock(client, response=None, error=None):
+    """Reset a shared Gemini client mock and set what generate_content does."""
+    generate_content = client.models.generate_content
+    generate_content.reset_mock(return_value=True, side_effect=True)
+    generate_content.return_value = response
+    generate_content.side_effect = error
+    return client
+
+
+def make_openai_stub(parsed):
+    """Build an OpenAI client stub whose structured parse returns ``parsed``."""
+    response = _fake_openai_response(parsed)
+    return SimpleNamespace(
+        chat=SimpleNamespace(completions=SimpleNamespace(parse=lambda **kwargs: response))
+    )
+
+
+class TestFortuneService(SimpleTestCase):
+    """Test cases for FortuneService that need no database access."""
+
+    # Shared, read-only inputs for generate_fortune_with_ai
+    COMPATIBILITY_GOOD = {
+        **_COMPATIBILITY_BASE,
+        "score": 75,
+        "level": "좋음",
+        "element_relation": "상생 (相生)",
+        "relation_detail": "목이 화를 도와줍니다",
+        "message": "긍정적인 에너지가 당신을 도울 것입니다."
+    }
+    COMPATIBILITY_NEUTRAL = {
+        **_COMPATIBILITY_BASE,
+        "score": 50,
+        "level": "보통",
+        "element_relation": "중립",
+        "relation_detail": "중립적인 관계",
+        "message": "평온한 하루가 될 것입니다."
+    }
+    FORTUNE_SCORE_NEEDS_WATER = _make_fortune_score(75.0, "수", _WATER_POOR_DISTRIBUTION)
+    FORTUNE_SCORE_BALANCED = _make_fortune_score()
+
+    @classmethod
+    def setUpClass(cls):
+        """Build the shared service and GanJi fixtures once."""
+        super().setUpClass()
+        cls.GJ = {
+            name: GanJi.find_by_name(name)
+            for name in ('갑자', '병인', '무신', '임오', '을해', '갑인', '병오', '무진')
+        }
+        # The AI generators only read the Saju, never the user row
+        cls.user_saju = Saju(cls.GJ['갑자'], cls.GJ['병인'], cls.GJ['무신'], cls.GJ['임오'])
+        # Patch Gemini modules for the whole class (OpenAI is patched for the whole module)
+        gemini_patcher = patch.multiple(fortune_module, genai=DEFAULT, Image=DEFAULT)
+        gemini_patcher.start()
+        cls.addClassCleanup(gemini_patcher.stop)
+        with patch.object(fortune_module, 'GEMINI_AVAILABLE', True):
+            cls.service = FortuneService()
+        cls._client = cls.service.client
+        cls._gemini_client = cls.service.gemini_client
+        # Reused Gemini client mock, reconfigured per test
+        cls.gemini_mock = Mock()
 
     def setUp(self):
         """Set up test fixtures."""
-        # Patch both OpenAI and Gemini modules
-        with patch('core.services.fortune.openai'), \
-             patch('core.services.fortune.GEMINI_AVAILABLE', True), \
-             patch('core.services.fortune.genai'), \
-             patch('core.services.fortune.Image'):
-            self.service = FortuneService()
+        # Tests swap the AI clients on the shared service; restore them
+        self.service.client = self._client
+        self.service.gemini_client = self._gemini_client
         self.user_id = 1
-        self.test_date = datetime(2024, 1, 1, 12, 0, 0)
+
+    def _stub_user_images(self, photos):
+        """Make the shared image service return ``photos`` for any date."""
+        image_service = self.service.image_service
+        image_service.get_user_images_for_date = lambda *args, **kwargs: list(photos)
+        self.addCleanup(delattr, image_service, 'get_user_images_for_date')
 
     def test_calculate_day_ganji(self):
         """Test day pillar (GanJi) calculation."""
-        from core.utils.saju_concepts import GanJi
-
         date1 = datetime(2024, 1, 1)
         ganji1 = self.service.calculate_day_ganji(date1)
 
@@ -48,40 +221,18 @@ class TestFortuneService(TestCase):
         ganji3 = self.service.calculate_day_ganji(date2)
         self.assertIsInstance(ganji3, GanJi)
 
-    def test_get_user_saju_info(self):
-        """Test retrieving user Saju information."""
-        from django.contrib.auth import get_user_model
-        from core.utils.saju_concepts import Saju
+    def test_get_saju_for_user_incomplete(self):
+        """Test Saju lookup rejects a user with missing pillars."""
+        user = User(email='incomplete@example.com', yearly_ganji='갑자', monthly_ganji='병인')
 
-        User = get_user_model()
-
-        # Create a user with complete saju data
-        user = User.objects.create_user(
-            email='testuser@example.com',
-            password='testpass123',
-            yearly_ganji='갑자',
-            monthly_ganji='병인',
-            daily_ganji='무신',
-            hourly_ganji='임오'
-        )
-
-        saju = self.service.get_user_saju_info(user.id)
-
-        self.assertIsInstance(saju, Saju)
-        self.assertIsNotNone(saju.yearly)
-        self.assertIsNotNone(saju.monthly)
-        self.assertIsNotNone(saju.daily)
-        self.assertIsNotNone(saju.hourly)
-        self.assertEqual(saju.yearly.two_letters, '갑자')
-        self.assertEqual(saju.daily.two_letters, '무신')
+        with self.assertRaises(ValueError):
+            self.service.get_saju_for_user(user)
 
     def test_analyze_saju_compatibility(self):
         """Test Saju compatibility analysis."""
-        from core.utils.saju_concepts import GanJi
-
         # 무신 (土) and 을해 (木)
-        user_day_ganji = GanJi.find_by_name("무신")
-        tomorrow_day_ganji = GanJi.find_by_name("을해")
+        user_day_ganji = self.GJ['무신']
+        tomorrow_day_ganji = self.GJ['을해']
 
         compatibility = self.service.analyze_saju_compatibility(
             user_day_ganji, tomorrow_day_ganji
@@ -97,12 +248,10 @@ class TestFortuneService(TestCase):
 
     def test_analyze_saju_compatibility_levels(self):
         """Test different compatibility levels."""
-        from core.utils.saju_concepts import GanJi
-
         # Test empowers (상생) - 목생화 (Wood empowers Fire)
         # 갑인 (木) empowers 병오 (火) → high score
-        user_ganji_empowers = GanJi.find_by_name("갑인")  # 木
-        tomorrow_ganji_empowers = GanJi.find_by_name("병오")  # 火
+        user_ganji_empowers = self.GJ['갑인']  # 木
+        tomorrow_ganji_empowers = self.GJ['병오']  # 火
 
         compat_empowers = self.service.analyze_saju_compatibility(
             user_ganji_empowers, tomorrow_ganji_empowers
@@ -112,8 +261,8 @@ class TestFortuneService(TestCase):
 
         # Test weakens (상극) - 목극토 (Wood weakens Earth)
         # 갑인 (木) weakens 무진 (土) → low score
-        user_ganji_weakens = GanJi.find_by_name("갑인")  # 木
-        tomorrow_ganji_weakens = GanJi.find_by_name("무진")  # 土
+        user_ganji_weakens = self.GJ['갑인']  # 木
+        tomorrow_ganji_weakens = self.GJ['무진']  # 土
 
         compat_weakens = self.service.analyze_saju_compatibility(
             user_ganji_weakens, tomorrow_ganji_weakens
@@ -123,201 +272,65 @@ class TestFortuneService(TestCase):
 
     def test_prepare_photo_context_with_photos(self):
         """Test preparing photo context with existing photos."""
-        with patch.object(self.service.image_service, 'get_user_images_for_date') as mock_get_images:
-            mock_get_images.return_value = [
-                {
-                    'filename': 'photo1.jpg',
-                    'url': '/media/photo1.jpg',
-                    'path': '/path/to/photo1.jpg'
-                },
-                {
-                    'filename': 'photo2.jpg',
-                    'url': '/media/photo2.jpg',
-                    'path': '/path/to/photo2.jpg'
-                }
-            ]
-
-            contexts = self.service.prepare_photo_context(
-                self.user_id, self.test_date
-            )
-
-            self.assertEqual(len(contexts), 2)
-            self.assertEqual(contexts[0]['filename'], 'photo1.jpg')
-            self.assertIn('metadata', contexts[0])
-            self.assertIn('timestamp', contexts[0]['metadata'])
-            self.assertIn('location', contexts[0]['metadata'])
-
-    def test_prepare_photo_context_without_photos(self):
-        """Test preparing photo context without photos."""
-        with patch.object(self.service.image_service, 'get_user_images_for_date') as mock_get_images:
-            mock_get_images.return_value = []
-
-            contexts = self.service.prepare_photo_context(
-                self.user_id, self.test_date
-            )
+        self._stub_user_images(_PHOTOS_TWO)
 
-            self.assertEqual(len(contexts), 1)
-            self.assertEqual(contexts[0]['filename'], 'no_photo')
-            self.assertIsNone(contexts[0]['metadata']['location'])
+        contexts = self.service.prepare_photo_context(
+            self.user_id, _TEST_DATE
+        )
 
-    @patch('openai.OpenAI')
-    def test_generate_fortune_with_ai_success(self, mock_openai):
-        """Test successful AI fortune generation."""
-        from django.contrib.auth import get_user_model
-        from core.utils.saju_concepts import Saju, GanJi
+        self.assertEqual(len(contexts), 2)
+        self.assertEqual(contexts[0]['filename'], 'photo1.jpg')
+        self.assertIn('metadata', contexts[0])
+        self.assertIn('timestamp', contexts[0]['metadata'])
+        self.assertIn('location', contexts[0]['metadata'])
 
-        User = get_user_model()
+    def test_prepare_photo_context_without_photos(self):
+        """Test preparing photo context without photos."""
+        self._stub_user_images(())
 
-        # Create a user with complete saju data
-        user = User.objects.create_user(
-            email='aitest@example.com',
-            password='testpass123',
-            yearly_ganji='갑자',
-            monthly_ganji='병인',
-            daily_ganji='무신',
-            hourly_ganji='임오'
+        contexts = self.service.prepare_photo_context(
+            self.user_id, _TEST_DATE
         )
 
+        self.assertEqual(len(contexts), 1)
+        self.assertEqual(contexts[0]['filename'], 'no_photo')
+        self.assertIsNone(contexts[0]['metadata']['location'])
+
+    def test_generate_fortune_with_ai(self):
+        """Test AI fortune generation on success and on error."""
         # Mock OpenAI response with parsed structure
         mock_parsed = FortuneAIResponse(
             today_fortune_summary="오늘은 조화로운 날! 수의 기운을 모아 균형을 찾아보세요.",
             today_element_balance_description="당신의 토행과 오늘의 목행이 만나 조화를 이룹니다. 긍정적인 하루가 될 것입니다.",
             today_daily_guidance="새로운 시작에 좋은 날입니다. 창의적인 활동을 시도해보세요."
         )
-        mock_response = Mock()
-        mock_response.choices = [Mock()]
-        mock_response.choices[0].message.parsed = mock_parsed
 
-        mock_client = Mock()
-        mock_client.chat.completions.parse.return_value = mock_response
-        self.service.client = mock_client
+        # (case, client, compatibility, fortune score, expected balance description fragments)
+        # A missing client makes the service fall back to its default fortune
+        cases = [
+            ('success', make_openai_stub(mock_parsed), self.COMPATIBILITY_GOOD,
+             self.FORTUNE_SCORE_NEEDS_WATER, ("토행", "목행")),
+            ('failure', None, self.COMPATIBILITY_NEUTRAL,
+             self.FORTUNE_SCORE_BALANCED, ("토", "목")),
+        ]
 
         # Test data
-        user_saju = self.service.get_user_saju_info(user.id)
-        tomorrow_date = self.test_date + timedelta(days=1)
-        tomorrow_day_ganji = GanJi.find_by_name("갑자")
-
-        compatibility = {
-            "score": 75,
-            "level": "좋음",
-            "element_relation": "상생 (相生)",
-            "relation_detail": "목이 화를 도와줍니다",
-            "user_element": "토",
-            "user_element_color": "노란",
-            "tomorrow_element": "목",
-            "tomorrow_element_color": "푸른",
-            "user_ganji": "무신",
-            "tomorrow_ganji": "갑자",
-            "message": "긍정적인 에너지가 당신을 도울 것입니다."
-        }
-
-        # Create fortune_score mock
-        from core.services.fortune import FortuneScore, ElementDistribution
-        fortune_score = FortuneScore(
-            entropy_score=75.0,
-            elements={
-                "대운": None,
-                "세운": {"two_letters": "갑자"},
-                "월운": {"two_letters": "병인"},
-                "일운": {"two_letters": "무신"},
-                "년주": None,
-                "월주": None,
-                "일주": None,
-                "시주": None,
-            },
-            element_distribution={
-                "목": ElementDistribution(count=3, percentage=20.0),
-                "화": ElementDistribution(count=3, percentage=20.0),
-                "토": ElementDistribution(count=4, percentage=26.7),
-                "금": ElementDistribution(count=3, percentage=20.0),
-                "수": ElementDistribution(count=2, percentage=13.3)
-            },
-            interpretation="Test interpretation",
-            needed_element="수"
-        )
-
-        result = self.service.generate_fortune_with_ai(
-            user_saju, tomorrow_date, tomorrow_day_ganji, compatibility, fortune_score
-        )
-
-        self.assertIsInstance(result, FortuneAIResponse)
-        self.assertIsNotNone(result.today_element_balance_description)
-        self.assertIsNotNone(result.today_daily_guidance)
-        self.assertIn("토행", result.today_element_balance_description)
-        self.assertIn("목행", result.today_element_balance_description)
-
-    def test_generate_fortune_with_ai_failure(self):
-        """Test AI fortune generation with error."""
-        from django.contrib.auth import get_user_model
-        from core.utils.saju_concepts import GanJi
+        user_saju = self.user_saju
+        tomorrow_day_ganji = self.GJ['갑자']
 
-        User = get_user_model()
-
-        # Create a user with complete saju data
-        user = User.objects.create_user(
-            email='aifailtest@example.com',
-            password='testpass123',
-            yearly_ganji='갑자',
-            monthly_ganji='병인',
-            daily_ganji='무신',
-            hourly_ganji='임오'
-        )
-
-        # Mock OpenAI client to raise exception
-        self.service.client = None
-
-        user_saju = self.service.get_user_saju_info(user.id)
-        tomorrow_date = self.test_date + timedelta(days=1)
-        tomorrow_day_ganji = GanJi.find_by_name("갑자")
-        compatibility = {
-            "score": 50,
-            "level": "보통",
-            "element_relation": "중립",
-            "relation_detail": "중립적인 관계",
-            "user_element": "토",
-            "user_element_color": "노란",
-            "tomorrow_element": "목",
-            "tomorrow_element_color": "푸른",
-            "user_ganji": "무신",
-            "tomorrow_ganji": "갑자",
-            "message": "평온한 하루가 될 것입니다."
-        }
-
-        # Create fortune_score mock
-        from core.services.fortune import FortuneScore, ElementDistribution
-        fortune_score = FortuneScore(
-            entropy_score=50.0,
-            elements={
-                "대운": None,
-                "세운": {"two_letters": "갑자"},
-                "월운": {"two_letters": "병인"},
-                "일운": {"two_letters": "무신"},
-                "년주": None,
-                "월주": None,
-                "일주": None,
-                "시주": None,
-            },
-            element_distribution={
-                "목": ElementDistribution(count=3, percentage=20.0),
-                "화": ElementDistribution(count=3, percentage=20.0),
-                "토": ElementDistribution(count=3, percentage=20.0),
-                "금": ElementDistribution(count=3, percentage=20.0),
-                "수": ElementDistribution(count=3, percentage=20.0)
-            },
-            interpretation="Test interpretation",
-            needed_element="목"
-        )
+        for case, client, compatibility, fortune_score, fragments in cases:
+            with self.subTest(case=case):
+                self.service.client = client
 
-        result = self.service.generate_fortune_with_ai(
-            user_saju, tomorrow_date, tomorrow_day_ganji, compatibility, fortune_score
-        )
+                result = self.service.generate_fortune_with_ai(
+                    user_saju, _TOMORROW, tomorrow_day_ganji, compatibility, fortune_score
+                )
 
-        # Should return default fortune on error
-        self.assertIsInstance(result, FortuneAIResponse)
-        self.assertIsNotNone(result.today_element_balance_description)
-        self.assertIsNotNone(result.today_daily_guidance)
-        self.assertIn(compatibility['user_element'], result.today_element_balance_description)
-        self.assertIn(compatibility['tomorrow_element'], result.today_element_balance_description)
+                self.assertIsInstance(result, FortuneAIResponse)
+                self.assertIsNotNone(result.today_element_balance_description)
+                self.assertIsNotNone(result.today_daily_guidance)
+                for fragment in fragments:
+                    self.assertIn(fragment, result.today_element_balance_description)
 
     def test_get_element_color(self):
         """Test _get_element_color helper method."""
@@ -329,58 +342,15 @@ class TestFortuneService(TestCase):
         # Invalid element should return default
         self.assertEqual(self.service._get_element_color("invalid"), "무지개색")
 
-    @patch('core.services.fortune.Image')
-    @patch('core.services.fortune.genai')
-    def test_generate_fortune_image_with_ai_success(self, mock_genai, mock_image_module):
+    def test_generate_fortune_image_with_ai_success(self):
         """Test successful fortune image generation with AI using Gemini."""
-        from django.contrib.auth import get_user_model
-        from core.utils.saju_concepts import GanJi
-        from core.services.fortune import FortuneScore, ElementDistribution
-
-        User = get_user_model()
-
-        # Create a user with complete saju data
-        user = User.objects.create_user(
-            email='imagetest@example.com',
-            password='testpass123',
-            yearly_ganji='갑자',
-            monthly_ganji='병인',
-            daily_ganji='무신',
-            hourly_ganji='임오'
-        )
-
-        # Create a mock image bytes (PNG format)
-        mock_image_bytes = b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x01\x00\x00\x00\x01\x08\x06\x00\x00\x00\x1f\x15\xc4\x89\x00\x00\x00\rIDATx\x9cc\x00\x01\x00\x00\x05\x00\x01\r\n-\xb4\x00\x00\x00\x00IEND\xaeB`\x82'
-
-        # Mock PIL Image
-        mock_pil_image = Mock()
-        mock_image_module.open.return_value = mock_pil_image
-
-        # Mock Gemini API response structure
-        mock_inline_data = Mock()
-        mock_inline_data.data = mock_image_bytes
-
-        mock_part = Mock()
-        mock_part.inline_data = mock_inline_data
-
-        mock_content = Mock()
-        mock_content.parts = [mock_part]
-
-        mock_candidate = Mock()
-        mock_candidate.content = mock_content
-
-        mock_response = Mock()
-        mock_response.candidates = [mock_candidate]
-
         # Mock Gemini client
-        mock_gemini_client = Mock()
-        mock_gemini_client.models.generate_content.return_value = mock_response
+        mock_gemini_client = configure_gemini_mock(self.gemini_mock, make_gemini_response(_TINY_PNG))
         self.service.gemini_client = mock_gemini_client
 
         # Create test data
-        user_saju = self.service.get_user_saju_info(user.id)
-        tomorrow_date = self.test_date + timedelta(days=1)
-        tomorrow_day_ganji = GanJi.find_by_name("갑자")
+        user_saju = self.user_saju
+        tomorrow_day_ganji = self.GJ['갑자']
 
         fortune_response = FortuneAIResponse(
             today_fortune_summary="오늘은 재물운이 좋은 날! 수의 기운을 모아보세요.",
@@ -388,34 +358,13 @@ class TestFortuneService(TestCase):
             today_daily_guidance="일상 가이드"
         )
 
-        fortune_score = FortuneScore(
-            entropy_score=75.0,
-            elements={
-                "대운": None,
-                "세운": {"two_letters": "갑자"},
-                "월운": {"two_letters": "병인"},
-                "일운": {"two_letters": "무신"},
-                "년주": None,
-                "월주": None,
-                "일주": None,
-                "시주": None,
-            },
-            element_distribution={
-                "목": ElementDistribution(count=3, percentage=20.0),
-                "화": ElementDistribution(count=3, percentage=20.0),
-                "토": ElementDistribution(count=4, percentage=26.7),
-                "금": ElementDistribution(count=3, percentage=20.0),
-                "수": ElementDistribution(count=2, percentage=13.3)
-            },
-            interpretation="Test interpretation",
-            needed_element="수"
-        )
+        fortune_score = self.FORTUNE_SCORE_NEEDS_WATER
 
         # Call the method
         result = self.service.generate_fortune_image_with_ai(
             fortune_response,
             user_saju,
-            tomorrow_date,
+            _TOMORROW,
             tomorrow_day_ganji,
             fortune_score
         )
@@ -445,104 +394,17 @@ class TestFortuneService(TestCase):
         self.assertIn("물 (Water)", prompt_text)  # needed_element_desc
         self.assertIn("오행 균형 설명", prompt_text)  # today_element_balance_description content
 
-    def test_generate_fortune_image_with_ai_no_client(self):
-        """Test fortune image generation when Gemini client is not initialized."""
-        from django.contrib.auth import get_user_model
-        from core.utils.saju_concepts import GanJi
-        from core.services.fortune import FortuneScore, ElementDistribution
+    def test_generate_fortune_image_with_ai_failures(self):
+        """Test fortune image generation returns None when Gemini cannot produce an image."""
+        # (case, generate_content behaviour); None means no Gemini client at all
+        cases = [
+            ('no_client', None),
+            ('no_image_data', {'response': make_gemini_response()}),  # empty candidates
+            ('api_exception', {'error': Exception("Gemini API Error")}),
+        ]
 
-        User = get_user_model()
-
-        user = User.objects.create_user(
-            email='imagenoclient@example.com',
-            password='testpass123',
-            yearly_ganji='갑자',
-            monthly_ganji='병인',
-            daily_ganji='무신',
-            hourly_ganji='임오'
-        )
-
-        # Set gemini_client to None
-        self.service.gemini_client = None
-
-        user_saju = self.service.get_user_saju_info(user.id)
-        tomorrow_date = self.test_date + timedelta(days=1)
-        tomorrow_day_ganji = GanJi.find_by_name("갑자")
-
-        fortune_response = FortuneAIResponse(
-            today_fortune_summary="테스트 요약",
-            today_element_balance_description="균형 설명",
-            today_daily_guidance="일상 가이드"
-        )
-
-        fortune_score = FortuneScore(
-            entropy_score=50.0,
-            elements={
-                "대운": None,
-                "세운": {"two_letters": "갑자"},
-                "월운": {"two_letters": "병인"},
-                "일운": {"two_letters": "무신"},
-                "년주": None,
-                "월주": None,
-                "일주": None,
-                "시주": None,
-            },
-            element_distribution={
-                "목": ElementDistribution(count=3, percentage=20.0),
-                "화": ElementDistribution(count=3, percentage=20.0),
-                "토": ElementDistribution(count=3, percentage=20.0),
-                "금": ElementDistribution(count=3, percentage=20.0),
-                "수": ElementDistribution(count=3, percentage=20.0)
-            },
-            interpretation="Test",
-            needed_element="목"
-        )
-
-        result = self.service.generate_fortune_image_with_ai(
-            fortune_response,
-            user_saju,
-            tomorrow_date,
-            tomorrow_day_ganji,
-            fortune_score
-        )
-
-        # Should return None on error
-        self.assertIsNone(result)
-
-    @patch('core.services.fortune.Image')
-    @patch('core.services.fortune.genai')
-    def test_generate_fortune_image_with_ai_no_image_data(self, mock_genai, mock_image_module):
-        """Test fortune image generation when Gemini API returns no image data."""
-        from django.contrib.auth import get_user_model
-        from core.utils.saju_concepts import GanJi
-        from core.services.fortune import FortuneScore, ElementDistribution
-
-        User = get_user_model()
-
-        user = User.objects.create_user(
-            email='imagenodata@example.com',
-            password='testpass123',
-            yearly_ganji='갑자',
-            monthly_ganji='병인',
-            daily_ganji='무신',
-            hourly_ganji='임오'
-        )
-
-        # Mock PIL Image
-        mock_pil_image = Mock()
-        mock_image_module.open.return_value = mock_pil_image
-
-        # Mock Gemini API response with empty candidates
-        mock_response = Mock()
-        mock_response.candidates = []  # No candidates
-
-        mock_gemini_client = Mock()
-        mock_gemini_client.models.generate_content.return_value = mock_response
-        self.service.gemini_client = mock_gemini_client
-
-        user_saju = self.service.get_user_saju_info(user.id)
-        tomorrow_date = self.test_date + timedelta(days=1)
-        tomorrow_day_ganji = GanJi.find_by_name("갑자")
+        user_saju = self.user_saju
+        tomorrow_day_ganji = self.GJ['갑자']
 
         fortune_response = FortuneAIResponse(
             today_fortune_summary="테스트 요약",
@@ -550,148 +412,62 @@ class TestFortuneService(TestCase):
             today_daily_guidance="일상 가이드"
         )
 
-        fortune_score = FortuneScore(
-            entropy_score=50.0,
-            elements={
-                "대운": None,
-                "세운": {"two_letters": "갑자"},
-                "월운": {"two_letters": "병인"},
-                "일운": {"two_letters": "무신"},
-                "년주": None,
-                "월주": None,
-                "일주": None,
-                "시주": None,
-            },
-            element_distribution={
-                "목": ElementDistribution(count=3, percentage=20.0),
-                "화": ElementDistribution(count=3, percentage=20.0),
-                "토": ElementDistribution(count=3, percentage=20.0),
-                "금": ElementDistribution(count=3, percentage=20.0),
-                "수": ElementDistribution(count=3, percentage=20.0)
-            },
-            interpretation="Test",
-            needed_element="목"
-        )
+        fortune_score = self.FORTUNE_SCORE_BALANCED
 
-        result = self.service.generate_fortune_image_with_ai(
-            fortune_response,
-            user_saju,
-            tomorrow_date,
-            tomorrow_day_ganji,
-            fortune_score
-        )
+        for case, gemini in cases:
+            with self.subTest(case=case):
+                self.service.gemini_client = (
+                    None if gemini is None else configure_gemini_mock(self.gemini_mock, **gemini)
+                )
 
-        # Should return None when no image data
-        self.assertIsNone(result)
+                result = self.service.generate_fortune_image_with_ai(
+                    fortune_response,
+                    user_saju,
+                    _TOMORROW,
+                    tomorrow_day_ganji,
+                    fortune_score
+                )
 
-    @patch('core.services.fortune.Image')
-    @patch('core.services.fortune.genai')
-    def test_generate_fortune_image_with_ai_api_exception(self, mock_genai, mock_image_module):
-        """Test fortune image generation when Gemini API raises exception."""
-        from django.contrib.auth import get_user_model
-        from core.utils.saju_concepts import GanJi
-        from core.services.fortune import FortuneScore, ElementDistribution
+                self.assertIsNone(result)
 
-        User = get_user_model()
+class TestFortuneServiceIntegration(TestCase):
+    """Integration tests for FortuneService."""
 
-        user = User.objects.create_user(
-            email='imageexception@example.com',
+    @classmethod
+    def setUpTestData(cls):
+        """Create the user with complete saju data once for the class."""
+        cls.user = User.objects.create_user(
+            email='fortuneintegration@example.com',
             password='testpass123',
+            birth_date_solar=date(1990, 1, 1),
+            birth_time_units='23',
             yearly_ganji='갑자',
             monthly_ganji='병인',
             daily_ganji='무신',
             hourly_ganji='임오'
         )
 
-        # Mock PIL Image
-        mock_pil_image = Mock()
-        mock_image_module.open.return_value = mock_pil_image
+    @classmethod
+    def setUpClass(cls):
+        """Build the shared service once."""
+        super().setUpClass()
+        with patch.multiple(fortune_module, GEMINI_AVAILABLE=True, genai=DEFAULT, Image=DEFAULT):
+            cls.service = FortuneService()
+        cls._client = cls.service.client
+        cls._gemini_client = cls.service.gemini_client
+        # Reused Gemini client mock, reconfigured per test
+        cls.gemini_mock = Mock()
 
-        # Mock Gemini API to raise exception
-        mock_gemini_client = Mock()
-        mock_gemini_client.models.generate_content.side_effect = Exception("Gemini API Error")
-        self.service.gemini_client = mock_gemini_client
-
-        user_saju = self.service.get_user_saju_info(user.id)
-        tomorrow_date = self.test_date + timedelta(days=1)
-        tomorrow_day_ganji = GanJi.find_by_name("갑자")
-
-        fortune_response = FortuneAIResponse(
-            today_fortune_summary="테스트 요약",
-            today_element_balance_description="균형 설명",
-            today_daily_guidance="일상 가이드"
-        )
-
-        fortune_score = FortuneScore(
-            entropy_score=50.0,
-            elements={
-                "대운": None,
-                "세운": {"two_letters": "갑자"},
-                "월운": {"two_letters": "병인"},
-                "일운": {"two_letters": "무신"},
-                "년주": None,
-                "월주": None,
-                "일주": None,
-                "시주": None,
-            },
-            element_distribution={
-                "목": ElementDistribution(count=3, percentage=20.0),
-                "화": ElementDistribution(count=3, percentage=20.0),
-                "토": ElementDistribution(count=3, percentage=20.0),
-                "금": ElementDistribution(count=3, percentage=20.0),
-                "수": ElementDistribution(count=3, percentage=20.0)
-            },
-            interpretation="Test",
-            needed_element="목"
-        )
-
-        result = self.service.generate_fortune_image_with_ai(
-            fortune_response,
-            user_saju,
-            tomorrow_date,
-            tomorrow_day_ganji,
-            fortune_score
-        )
-
-        # Should return None on exception
-        self.assertIsNone(result)
-
-class TestFortuneServiceIntegration(TestCase):
-    """Integration tests for FortuneService."""
-
-    @patch('core.services.fortune.openai')
-    @patch('core.services.fortune.GEMINI_AVAILABLE', True)
-    @patch('core.services.fortune.genai')
-    @patch('core.services.fortune.Image')
-    def setUp(self, mock_image, mock_genai, mock_openai_model):
+    def setUp(self):
         """Set up test fixtures."""
-        self.service = FortuneService()
-        self.user_id = 1
+        # Tests swap the AI clients on the shared service; restore them
+        self.service.client = self._client
+        self.service.gemini_client = self._gemini_client
 
-    @patch('core.services.fortune.Image')
-    @patch('core.services.fortune.genai')
-    @patch('openai.OpenAI')
-    def test_generate_fortune_with_image(self, mock_openai, mock_genai, mock_image_module):
+    @patch.multiple(fortune_module, Image=DEFAULT, genai=DEFAULT)
+    def test_generate_fortune_with_image(self, **mocks):
         """Test generate_fortune includes image generation and saves it to DB."""
-        from django.contrib.auth import get_user_model
-        from core.models import FortuneResult
-        from core.services.fortune import FortuneAIResponse
-
-        User = get_user_model()
-
-        # Create a user with complete saju data
-        from datetime import date
-        user = User.objects.create_user(
-            email='fortuneimage@example.com',
-            password='testpass123'
-        )
-        user.birth_date_solar = date(1990, 1, 1)
-        user.birth_time_units = '23'
-        user.yearly_ganji = '갑자'
-        user.monthly_ganji = '병인'
-        user.daily_ganji = '무신'
-        user.hourly_ganji = '임오'
-        user.save()
+        user = self.user
 
         # Mock AI text response
         mock_parsed = FortuneAIResponse(
@@ -699,51 +475,27 @@ class TestFortuneServiceIntegration(TestCase):
             today_element_balance_description="균형 설명입니다.",
             today_daily_guidance="일상 가이드입니다."
         )
-        mock_text_response = Mock()
-        mock_text_response.choices = [Mock()]
-        mock_text_response.choices[0].message.parsed = mock_parsed
-
-        # Mock Gemini image response
-        mock_image_bytes = b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x01\x00\x00\x00\x01\x08\x06\x00\x00\x00\x1f\x15\xc4\x89\x00\x00\x00\rIDATx\x9cc\x00\x01\x00\x00\x05\x00\x01\r\n-\xb4\x00\x00\x00\x00IEND\xaeB`\x82'
-
-        # Mock PIL Image
-        mock_pil_image = Mock()
-        mock_image_module.open.return_value = mock_pil_image
-
-        # Mock Gemini response structure
-        mock_inline_data = Mock()
-        mock_inline_data.data = mock_image_bytes
-        mock_part = Mock()
-        mock_part.inline_data = mock_inline_data
-        mock_content = Mock()
-        mock_content.parts = [mock_part]
-        mock_candidate = Mock()
-        mock_candidate.content = mock_content
-        mock_gemini_response = Mock()
-        mock_gemini_response.candidates = [mock_candidate]
+
+        # Hand the character path through instead of a decoded PIL image
+        mocks['Image'].open.side_effect = lambda path: path
 
         # Set up mock clients
-        mock_client = Mock()
-        mock_client.chat.completions.parse.return_value = mock_text_response
-        self.service.client = mock_client
+        self.service.client = make_openai_stub(mock_parsed)
 
-        mock_gemini_client = Mock()
-        mock_gemini_client.models.generate_content.return_value = mock_gemini_response
+        mock_gemini_client = configure_gemini_mock(self.gemini_mock, make_gemini_response(_TINY_PNG))
         self.service.gemini_client = mock_gemini_client
 
         # Generate fortune
-        test_date = datetime(2024, 1, 1, 12, 0, 0)
-        result = self.service.generate_fortune(user, test_date)
+        result = self.service.generate_fortune(user, _TEST_DATE)
 
         # Verify result status
         self.assertEqual(result.status, 'success')
         self.assertIsNotNone(result.data)
 
         # Verify FortuneResult was saved to DB
-        tomorrow_date = (test_date + timedelta(days=1)).date()
         fortune_result = FortuneResult.objects.get(
             user=user,
-            for_date=tomorrow_date
+            for_date=_TOMORROW.date()
         )
 
         # Verify fortune data (placeholder initially)
@@ -760,30 +512,10 @@ class TestFortuneServiceIntegration(TestCase):
         # Verify placeholder message
         self.assertIn('운세를 생성하고 있습니다', fortune_result.fortune_data['today_fortune_summary'])
 
-    @patch('core.services.fortune.Image')
-    @patch('core.services.fortune.genai')
-    @patch('openai.OpenAI')
-    def test_generate_fortune_without_image_on_failure(self, mock_openai, mock_genai, mock_image_module):
+    @patch.multiple(fortune_module, Image=DEFAULT, genai=DEFAULT)
+    def test_generate_fortune_without_image_on_failure(self, **mocks):
         """Test generate_fortune saves fortune even if image generation fails."""
-        from django.contrib.auth import get_user_model
-        from core.models import FortuneResult
-        from core.services.fortune import FortuneAIResponse
-
-        User = get_user_model()
-
-        # Create a user with complete saju data
-        from datetime import date
-        user = User.objects.create_user(
-            email='fortunenoimageonfail@example.com',
-            password='testpass123'
-        )
-        user.birth_date_solar = date(1990, 1, 1)
-        user.birth_time_units = '23'
-        user.yearly_ganji = '갑자'
-        user.monthly_ganji = '병인'
-        user.daily_ganji = '무신'
-        user.hourly_ganji = '임오'
-        user.save()
+        user = self.user
 
         # Mock AI text response (success)
         mock_parsed = FortuneAIResponse(
@@ -791,37 +523,28 @@ class TestFortuneServiceIntegration(TestCase):
             today_element_balance_description="균형 설명입니다.",
             today_daily_guidance="일상 가이드입니다."
         )
-        mock_text_response = Mock()
-        mock_text_response.choices = [Mock()]
-        mock_text_response.choices[0].message.parsed = mock_parsed
 
-        # Mock PIL Image
-        mock_pil_image = Mock()
-        mock_image_module.open.return_value = mock_pil_image
+        # Hand the character path through instead of a decoded PIL image
+        mocks['Image'].open.side_effect = lambda path: path
 
         # Set up mock client with image generation failure
-        mock_client = Mock()
-        mock_client.chat.completions.parse.return_value = mock_text_response
-        self.service.client = mock_client
+        self.service.client = make_openai_stub(mock_parsed)
 
         # Mock Gemini to raise exception
-        mock_gemini_client = Mock()
-        mock_gemini_client.models.generate_content.side_effect = Exception("Gemini API Error")
+        mock_gemini_client = configure_gemini_mock(self.gemini_mock, error=Exception("Gemini API Error"))
         self.service.gemini_client = mock_gemini_client
 
         # Generate fortune
-        test_date = datetime(2024, 1, 1, 12, 0, 0)
-        result = self.service.generate_fortune(user, test_date)
+        result = self.service.generate_fortune(user, _TEST_DATE)
 
         # Verify result status is still success
         self.assertEqual(result.status, 'success')
         self.assertIsNotNone(result.data)
 
         # Verify FortuneResult was saved to DB
-        tomorrow_date = (test_date + timedelta(days=1)).date()
         fortune_result = FortuneResult.objects.get(
             user=user,
-            for_date=tomorrow_date
+            for_date=_TOMORROW.date()
         )
 
         # Verify fortune data exists
@@ -831,24 +554,33 @@ class TestFortuneServiceIntegration(TestCase):
         # Verify image is NOT saved (but fortune is still created)
         self.assertFalse(fortune_result.fortune_image)
 
+    def test_get_user_saju_info(self):
+        """Test retrieving user Saju information."""
+        saju = self.service.get_user_saju_info(self.user.id)
+
+        self.assertIsInstance(saju, Saju)
+        self.assertIsNotNone(saju.yearly)
+        self.assertIsNotNone(saju.monthly)
+        self.assertIsNotNone(saju.daily)
+        self.assertIsNotNone(saju.hourly)
+        self.assertEqual(saju.yearly.two_letters, '갑자')
+        self.assertEqual(saju.daily.two_letters, '무신')
+
     def test_ganji_cycle_consistency(self):
         """Test that day pillar (GanJi) cycles correctly."""
-        from core.utils.saju_concepts import GanJi
-
         base_date = datetime(2024, 1, 1)
-        ganjis = []
 
-        # Generate ganjis for 60 consecutive days
-        for i in range(60):
-            date = base_date + timedelta(days=i)
-            ganji = self.service.calculate_day_ganji(date)
-            ganjis.append(ganji.two_letters)
+        # Day pillars for 61 consecutive days in one batch
+        letters = [
+            ganji.two_letters
+            for ganji in self.service.calculate_day_ganji_range(base_date, 61)
+        ]
+
+        # The batch agrees with the single-date calculation
+        self.assertEqual(letters[0], self.service.calculate_day_ganji(base_date).two_letters)
 
         # Check all ganjis are valid (60 unique combinations in cycle)
-        self.assertEqual(len(set(ganjis)), 60)
+        self.assertEqual(len(set(letters[:60])), 60)
 
         # 61st day should have same ganji as 1st day (60-day cycle)
-        date_61 = base_date + timedelta(days=60)
-        ganji_61 = self.service.calculate_day_ganji(date_61)
-        ganji_1 = self.service.calculate_day_ganji(base_date)
-        self.assertEqual(ganji_61.two_letters, ganji_1.two_letters)
\ No newline at end of file
+        self.assertEqual(letters[60], letters[0])
@@ -5,8 +5,8 @@ Unit tests for ImageService.
 import os
 import tempfile
 from io import BytesIO
-from datetime import datetime
-from unittest.mock import Mock, patch, MagicMock
+from datetime import datetime, timedelta
+from unittest.mock import DEFAULT, Mock, patch, MagicMock
 from PIL import Image
 import pytest
 from django.test import TestCase, override_settings
@@ -20,52 +20,82 @@ from ..models import ChakraImage
 User = get_user_model()
 
 
+def _encode_jpeg(size, color):
+    """Encode a solid-colour RGB image as JPEG bytes."""
+    img_io = BytesIO()
+    Image.new('RGB', size, color=color).save(img_io, format='JPEG')
+    return img_io.getvalue()
+
+
+# Encoded once; tests only need valid JPEG bytes without EXIF
+_TEST_JPEG = _encode_jpeg((100, 100), 'red')
+
+# The upload pipeline never checks dimensions, so one pixel is enough
+_TINY_JPEG = _encode_jpeg((1, 1), 'blue')
+
+# Stand-in for a decoded photo carrying EXIF data; only getexif() is read
+_EXIF_IMAGE = Mock()
+_EXIF_IMAGE.getexif.return_value = {
+    0x0132: "2024:01:01 12:00:00",  # DateTime
+    0x010F: "Samsung",  # Make
+    0x0110: "Galaxy S22",  # Model
+    0x0100: 1920,  # ImageWidth
+    0x0101: 1080,  # ImageLength
+    34853: {  # GPSInfo
+        1: 'N',  # GPSLatitudeRef
+        2: ((37, 1), (33, 1), (59, 1)),  # GPSLatitude
+        3: 'E',  # GPSLongitudeRef
+        4: ((126, 1), (58, 1), (41, 1)),  # GPSLongitude
+    }
+}
+
+# (EXIF GPS data, expected latitude, expected longitude)
+_GPS_CASES = (
+    ({  # Seoul: Northern and Eastern hemispheres
+        'GPSLatitude': ((37, 1), (33, 1), (59, 1)),
+        'GPSLatitudeRef': 'N',
+        'GPSLongitude': ((126, 1), (58, 1), (41, 1)),
+        'GPSLongitudeRef': 'E'
+    }, 37.5664, 126.9781),
+    ({  # Southern and Western hemispheres
+        'GPSLatitude': ((33, 1), (51, 1), (0, 1)),
+        'GPSLatitudeRef': 'S',
+        'GPSLongitude': ((151, 1), (12, 1), (0, 1)),
+        'GPSLongitudeRef': 'W'
+    }, -33.85, -151.2),
+)
+
+
 class TestImageService(TestCase):
     """Test cases for ImageService."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.service = ImageService()
-        self.user = User.objects.create_user(
+    # Read-only; made aware once instead of in every setUp
+    test_date = timezone.make_aware(datetime(2024, 1, 1, 12, 0, 0))
+
+    @classmethod
+    def setUpTestData(cls):
+        """Create the test user once for the class."""
+        cls.user = User.objects.create_user(
             email='test@example.com',
             password='testpass123'
         )
-        self.user_id = self.user.id
-        self.test_date = timezone.make_aware(datetime(2024, 1, 1, 12, 0, 0))
-
-    def create_test_image(self, with_exif=False):
-        """Create a test image for testing."""
-        # Create a simple image
-        image = Image.new('RGB', (100, 100), color='red')
-
-        # Add EXIF data if requested
-        if with_exif:
-            from PIL.ExifTags import TAGS, GPSTAGS
-            exif_data = image.getexif()
-
-            # Add basic EXIF tags
-            exif_data[0x0132] = "2024:01:01 12:00:00"  # DateTime
-            exif_data[0x010F] = "TestMake"  # Make
-            exif_data[0x0110] = "TestModel"  # Model
+        cls.user_id = cls.user.id
 
-            # Add GPS data (simplified)
-            # GPS tags are more complex and would require IFD structure
-            # For testing, we'll mock this in the test
-
-        # Save to BytesIO
-        img_io = BytesIO()
-        image.save(img_io, format='JPEG')
-        img_io.seek(0)
+    def setUp(self):
+        """Set up test fixtures."""
+        self.service = ImageService()
 
+    def create_test_image(self):
+        """Create a test image for testing."""
         return SimpleUploadedFile(
             name='test_image.jpg',
-            content=img_io.read(),
+            content=_TEST_JPEG,
             content_type='image/jpeg'
         )
 
     def test_extract_exif_data_without_exif(self):
         """Test extracting EXIF data from image without EXIF."""
-        image_file = self.create_test_image(with_exif=False)
+        image_file = self.create_test_image()
 
         metadata = self.service.extract_exif_data(image_file)
 
@@ -74,28 +104,10 @@ class TestImageService(TestCase):
         self.assertIsNone(metadata['device_info'])
         self.assertEqual(metadata['image_info'], {})
 
-    @patch('PIL.Image.open')
+    @patch.object(Image, 'open', return_value=_EXIF_IMAGE)
     def test_extract_exif_data_with_exif(self, mock_open):
         """Test extracting EXIF data from image with EXIF."""
-        # Create mock image with EXIF data
-        mock_image = Mock()
-        mock_exif = {
-            0x0132: "2024:01:01 12:00:00",  # DateTime
-            0x010F: "Samsung",  # Make
-            0x0110: "Galaxy S22",  # Model
-            0x0100: 1920,  # ImageWidth
-            0x0101: 1080,  # ImageLength
-            34853: {  # GPSInfo
-                1: 'N',  # GPSLatitudeRef
-                2: ((37, 1), (33, 1), (59, 1)),  # GPSLatitude
-                3: 'E',  # GPSLongitudeRef
-                4: ((126, 1), (58, 1), (41, 1)),  # GPSLongitude
-            }
-        }
-        mock_image.getexif.return_value = mock_exif
-        mock_open.return_value = mock_image
-
-        image_file = self.create_test_image(with_exif=False)
+        image_file = self.create_test_image()
         metadata = self.service.extract_exif_data(image_file)
 
         self.assertTrue(metadata['timestamp'].startswith("2024-01-01T12:00:00"))
@@ -103,34 +115,15 @@ class TestImageService(TestCase):
         self.assertEqual(metadata['device_info']['model'], "Galaxy S22")
 
     def test_convert_gps_to_decimal(self):
-        """Test GPS coordinate conversion."""
-        gps_data = {
-            'GPSLatitude': ((37, 1), (33, 1), (59, 1)),
-            'GPSLatitudeRef': 'N',
-            'GPSLongitude': ((126, 1), (58, 1), (41, 1)),
-            'GPSLongitudeRef': 'E'
-        }
-
-        location = self.service.convert_gps_to_decimal(gps_data)
-
-        self.assertIsNotNone(location)
-        self.assertAlmostEqual(location['latitude'], 37.5664, places=4)
-        self.assertAlmostEqual(location['longitude'], 126.9781, places=4)
-
-    def test_convert_gps_to_decimal_south_west(self):
-        """Test GPS conversion for Southern and Western hemispheres."""
-        gps_data = {
-            'GPSLatitude': ((33, 1), (51, 1), (0, 1)),
-            'GPSLatitudeRef': 'S',
-            'GPSLongitude': ((151, 1), (12, 1), (0, 1)),
-            'GPSLongitudeRef': 'W'
-        }
+        """Test GPS coordinate conversion in every hemisphere."""
+        for gps_data, latitude, longitude in _GPS_CASES:
+            with self.subTest(lat_ref=gps_data['GPSLatitudeRef'],
+                              lon_ref=gps_data['GPSLongitudeRef']):
+                location = self.service.convert_gps_to_decimal(gps_data)
 
-        location = self.service.convert_gps_to_decimal(gps_data)
-
-        self.assertIsNotNone(location)
-        self.assertLess(location['latitude'], 0)  # Southern hemisphere
-        self.assertLess(location['longitude'], 0)  # Western hemisphere
+                self.assertIsNotNone(location)
+                self.assertAlmostEqual(location['latitude'], latitude, places=4)
+                self.assertAlmostEqual(location['longitude'], longitude, places=4)
 
     @override_settings(USE_S3=False)
     def test_save_image(self):
@@ -153,11 +146,10 @@ class TestImageService(TestCase):
         self.assertEqual(chakra_image.latitude, 37.5665)
         self.assertEqual(chakra_image.longitude, 126.9780)
 
-    @patch.object(ImageService, 'save_image')
-    @patch.object(ImageService, 'extract_exif_data')
-    def test_process_image_upload_success(self, mock_extract, mock_save):
+    @patch.multiple(ImageService, save_image=DEFAULT, extract_exif_data=DEFAULT)
+    def test_process_image_upload_success(self, save_image, extract_exif_data):
         """Test successful image upload processing."""
-        mock_extract.return_value = {
+        extract_exif_data.return_value = {
             'timestamp': self.test_date.isoformat(),
             'location': {'latitude': 37.5665, 'longitude': 126.9780},
             'device_info': None,
@@ -168,7 +160,7 @@ class TestImageService(TestCase):
         mock_chakra.id = 1
         mock_chakra.image.url = '/media/chakras/1/2024-01-01/test.jpg'
         mock_chakra.created_at = self.test_date
-        mock_save.return_value = mock_chakra
+        save_image.return_value = mock_chakra
 
         image_file = self.create_test_image()
         additional_data = {'chakra_type': 'fire'}
@@ -195,23 +187,25 @@ class TestImageService(TestCase):
     @override_settings(USE_S3=False)
     def test_get_user_images_for_date(self):
         """Test retrieving user images for a specific date."""
-        # Create test images
-        img1 = ChakraImage.objects.create(
-            user_id=self.user_id,
-            image='test1.jpg',
-            chakra_type='fire',
-            date=self.test_date.date(),
-            timestamp=self.test_date,
-            latitude=37.5,
-            longitude=126.9
-        )
-        img2 = ChakraImage.objects.create(
-            user_id=self.user_id,
-            image='test2.jpg',
-            chakra_type='water',
-            date=self.test_date.date(),
-            timestamp=self.test_date
-        )
+        # Create test images; img1 is an hour older so the ordering is strict
+        img1, img2 = ChakraImage.objects.bulk_create([
+            ChakraImage(
+                user_id=self.user_id,
+                image='test1.jpg',
+                chakra_type='fire',
+                date=self.test_date.date(),
+                timestamp=self.test_date - timedelta(hours=1),
+                latitude=37.5,
+                longitude=126.9
+            ),
+            ChakraImage(
+                user_id=self.user_id,
+                image='test2.jpg',
+                chakra_type='water',
+                date=self.test_date.date(),
+                timestamp=self.test_date
+            ),
+        ])
 
         images = self.service.get_user_images_for_date(
             self.user_id, self.test_date
@@ -235,33 +229,28 @@ class TestImageService(TestCase):
 class TestImageServiceIntegration(TestCase):
     """Integration tests for ImageService."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.service = ImageService()
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        """Create the test user once for the class."""
+        cls.user = User.objects.create_user(
             email='integration@example.com',
             password='testpass123'
         )
-        self.user_id = self.user.id
+        cls.user_id = cls.user.id
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.service = ImageService()
 
     @override_settings(USE_S3=False)
     def test_full_image_processing_workflow(self):
         """Test complete image processing workflow."""
-        # Create test image
-        image = Image.new('RGB', (200, 200), color='blue')
-        img_io = BytesIO()
-        image.save(img_io, format='JPEG')
-
-        # Get size before seeking
-        size = img_io.tell()
-        img_io.seek(0)
-
         image_file = InMemoryUploadedFile(
-            img_io,
+            BytesIO(_TINY_JPEG),
             None,
             'test.jpg',
             'image/jpeg',
-            size,
+            len(_TINY_JPEG),
             None
         )
 
@@ -19,6 +19,14 @@ import boto3
 class TestPresignedURLEndToEnd(TestCase):
     """E2E tests for presigned URL upload workflow."""
 
+    @classmethod
+    def setUpTestData(cls):
+        """Create the test user once for the class."""
+        cls.user = User.objects.create_user(
+            email='e2e@example.com',
+            password='testpass123'
+        )
+
     def setUp(self):
         """Set up test fixtures with mocked S3."""
         # Create mock S3 bucket
@@ -34,12 +42,6 @@ class TestPresignedURLEndToEnd(TestCase):
         )
         self.s3_client.create_bucket(Bucket=self.bucket_name)
 
-        # Create test user
-        self.user = User.objects.create_user(
-            email='e2e@example.com',
-            password='testpass123'
-        )
-
         # Setup API client
         self.client = APIClient()
         self.client.force_authenticate(user=self.user)
@@ -246,6 +248,14 @@ class TestPresignedURLEndToEnd(TestCase):
 class TestPresignedURLPerformance(TestCase):
     """Performance and load tests for presigned URL generation."""
 
+    @classmethod
+    def setUpTestData(cls):
+        """Create the test user once for the class."""
+        cls.user = User.objects.create_user(
+            email='perf@example.com',
+            password='testpass123'
+        )
+
     def setUp(self):
         """Set up test fixtures."""
         self.bucket_name = 'test-bucket'
@@ -258,11 +268,6 @@ class TestPresignedURLPerformance(TestCase):
         )
         self.s3_client.create_bucket(Bucket=self.bucket_name)
 
-        self.user = User.objects.create_user(
-            email='perf@example.com',
-            password='testpass123'
-        )
-
         self.client = APIClient()
         self.client.force_authenticate(user=self.user)
 
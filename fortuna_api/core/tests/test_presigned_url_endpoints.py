@@ -7,7 +7,7 @@ from django.urls import reverse
 from django.utils import timezone
 from rest_framework.test import APITestCase
 from rest_framework import status
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, Mock
 from datetime import datetime
 from user.models import User
 
@@ -23,6 +23,9 @@ from user.models import User
 class TestPresignedURLEndpoints(APITestCase):
     """Test presigned URL API endpoints."""
 
+    # Read-only; made aware once instead of in every test
+    test_date = timezone.make_aware(datetime(2024, 1, 1, 12, 0, 0))
+
     def setUp(self):
         """Set up test user and authentication."""
         self.user = User.objects.create_user(
@@ -34,7 +37,7 @@ class TestPresignedURLEndpoints(APITestCase):
     @patch('core.services.image.ImageService._get_s3_client')
     def test_get_upload_presigned_url_success(self, mock_get_client):
         """Test successful retrieval of upload presigned URL."""
-        mock_s3_client = MagicMock()
+        mock_s3_client = Mock(spec=['generate_presigned_url'])
         mock_s3_client.generate_presigned_url.return_value = 'https://s3.example.com/upload-url'
         mock_get_client.return_value = mock_s3_client
 
@@ -51,7 +54,7 @@ class TestPresignedURLEndpoints(APITestCase):
     @patch('core.services.image.ImageService._get_s3_client')
     def test_get_upload_presigned_url_default_chakra_type(self, mock_get_client):
         """Test upload presigned URL with default chakra type."""
-        mock_s3_client = MagicMock()
+        mock_s3_client = Mock(spec=['generate_presigned_url'])
         mock_s3_client.generate_presigned_url.return_value = 'https://s3.example.com/upload-url'
         mock_get_client.return_value = mock_s3_client
 
@@ -90,13 +93,12 @@ class TestPresignedURLEndpoints(APITestCase):
         mock_generate_view.return_value = 'https://s3.example.com/view-url'
 
         # Create test image
-        test_date = timezone.make_aware(datetime(2024, 1, 1, 12, 0, 0))
         ChakraImage.objects.create(
             user_id=self.user.id,
             image='chakras/1/2024-01-01/test.jpg',
             chakra_type='test',
-            date=test_date.date(),
-            timestamp=test_date
+            date=self.test_date.date(),
+            timestamp=self.test_date
         )
 
         url = reverse('core:get_user_images')
@@ -115,6 +117,8 @@ class TestPresignedURLEndpoints(APITestCase):
 class TestPresignedURLEndpointsWithoutS3(APITestCase):
     """Test presigned URL endpoints when S3 is disabled."""
 
+    test_date = TestPresignedURLEndpoints.test_date
+
     def setUp(self):
         """Set up test user and authentication."""
         self.user = User.objects.create_user(
@@ -136,13 +140,12 @@ class TestPresignedURLEndpointsWithoutS3(APITestCase):
         """Test getting user images without presigned URLs."""
         from core.models import ChakraImage
 
-        test_date = timezone.make_aware(datetime(2024, 1, 1, 12, 0, 0))
         ChakraImage.objects.create(
             user_id=self.user.id,
             image='chakras/test.jpg',
             chakra_type='test',
-            date=test_date.date(),
-            timestamp=test_date
+            date=self.test_date.date(),
+            timestamp=self.test_date
         )
 
         url = reverse('core:get_user_images')
@@ -3,9 +3,14 @@ Tests for Saju (사주) calculation logic.
 """
 from datetime import date, time
 from django.test import TestCase
-from core.utils.saju_concepts import Saju, SajuCalculator
+from core.utils.saju_concepts import Saju, SajuCalculator, TimeUnits
 from user.models import User
 
+EXPECTED_TIME_UNITS = frozenset((
+    '자시', '축시', '인시', '묘시', '진시', '사시',
+    '오시', '미시', '신시', '유시', '술시', '해시',
+))
+
 
 class SajuCalculationTestCase(TestCase):
     """Test cases for Saju calculation"""
@@ -93,6 +98,24 @@ class SajuCalculationTestCase(TestCase):
         self.assertEqual(result['daily_ganji'], "갑술")
         self.assertEqual(result['hourly_ganji'], "기사")
 
+    def test_time_unit_coverage(self):
+        """
+        십이시 경계는 2시간 단위이므로 구간마다 대표 시각 하나만 확인한다.
+        (0:30~1:30 자시는 1시간 구간)
+        """
+        representative_hours = [1] + list(range(2, 23, 2))
+
+        time_units_found = set()
+        for hour in representative_hours:
+            with self.subTest(hour=hour):
+                unit = TimeUnits.from_time(time(hour, 0))
+                self.assertNotEqual(unit, TimeUnits.YA_JA_SI)
+                time_units_found.add(unit.value)
+
+        self.assertEqual(time_units_found, EXPECTED_TIME_UNITS)
+        self.assertEqual(TimeUnits.from_time(time(23, 45)), TimeUnits.YA_JA_SI)
+        self.assertEqual(TimeUnits.from_time(time(0, 15)), TimeUnits.YA_JA_SI)
+
 
 class SajuCalendarConversionTestCase(TestCase):
     """양력/음력 변환 및 사주 계산 테스트"""
@@ -171,46 +171,18 @@ class TimeUnits(Enum):
     @classmethod
     def from_time(cls, time_obj: time) -> 'TimeUnits':
         """시간으로부터 십이시 찾기 (Kotlin 로직과 동일)"""
-        from datetime import time as Time
-
-        # 시간 범위 매핑 테이블
-        time_ranges = [
-            (Time(0, 30), Time(1, 30), cls.JA_SI),
-            (Time(1, 30), Time(3, 30), cls.CHUK_SI),
-            (Time(3, 30), Time(5, 30), cls.IN_SI),
-            (Time(5, 30), Time(7, 30), cls.MYO_SI),
-            (Time(7, 30), Time(9, 30), cls.JIN_SI),
-            (Time(9, 30), Time(11, 30), cls.SA_SI),
-            (Time(11, 30), Time(13, 30), cls.O_SI),
-            (Time(13, 30), Time(15, 30), cls.MI_SI),
-            (Time(15, 30), Time(17, 30), cls.SIN_SI),
-            (Time(17, 30), Time(19, 30), cls.YU_SI),
-            (Time(19, 30), Time(21, 30), cls.SUL_SI),
-            (Time(21, 30), Time(23, 30), cls.HAE_SI),
-        ]
-
-        # 일반 시간대 확인
-        for start_time, end_time, time_unit in time_ranges:
-            if cls._is_time_in_range(time_obj, start_time, end_time):
-                return time_unit
+        # 십이시 경계는 모두 정각 또는 30분이므로 30분 단위 칸으로 바로 조회
+        half_hour_slot = time_obj.hour * 2 + (time_obj.minute >= 30)
+        return _TIME_UNITS_BY_HALF_HOUR[half_hour_slot]
 
-        # 야자시: 23:30 이후 또는 00:30 이전
-        if cls._is_ya_ja_si(time_obj):
-            return cls.YA_JA_SI
 
-        # 기본값
-        return cls.JA_SI
-
-    @staticmethod
-    def _is_time_in_range(time_value: time, start: time, end: time) -> bool:
-        """주어진 시간이 범위 내에 있는지 확인"""
-        return start <= time_value < end
-
-    @staticmethod
-    def _is_ya_ja_si(time_value: time) -> bool:
-        """야자시인지 확인 (23:30 이후 또는 00:30 이전)"""
-        from datetime import time as Time
-        return time_value < Time(0, 30) or time_value >= Time(23, 30)
+# 30분 단위 칸(0~47) -> 십이시 조회표
+# 자시 00:30~01:30, 축시 01:30~03:30, ... 해시 21:30~23:30
+# 야자시: 23:30 이후 또는 00:30 이전
+_TIME_UNITS_BY_HALF_HOUR = tuple(
+    TimeUnits.YA_JA_SI if slot in (0, 47) else list(TimeUnits)[(slot + 1) // 4]
+    for slot in range(48)
+)
 
 
 class SolarTerms(Enum):
@@ -432,6 +404,10 @@ class GanJi:
 
     # 60갑자 캐시 (Kotlin의 cached와 동일)
     _cached = None
+    # 두 글자 이름 -> 간지 캐시
+    _cached_by_name = None
+    # 두 글자 이름 -> 60갑자 인덱스 캐시
+    _cached_index_by_name = None
 
     def __init__(self, stem: TenStems, branch: TwelveBranches):
         self.stem = stem
@@ -448,6 +424,22 @@ class GanJi:
             ]
         return cls._cached
 
+    @classmethod
+    def _get_cached_by_name(cls):
+        """두 글자 이름으로 찾는 60갑자 캐시 생성"""
+        if cls._cached_by_name is None:
+            cls._cached_by_name = {ganji.two_letters: ganji for ganji in cls._get_cached()}
+        return cls._cached_by_name
+
+    @classmethod
+    def _get_cached_index_by_name(cls):
+        """두 글자 이름으로 60갑자 인덱스를 찾는 캐시 생성"""
+        if cls._cached_index_by_name is None:
+            cls._cached_index_by_name = {
+                ganji.two_letters: index for index, ganji in enumerate(cls._get_cached())
+            }
+        return cls._cached_index_by_name
+
     @classmethod
     def find_by_index(cls, index: int) -> 'GanJi':
         """인덱스로 간지 찾기 (Kotlin: GanJi.idxAt)"""
@@ -456,7 +448,11 @@ class GanJi:
     
     @classmethod
     def get_index(cls, ganji: 'GanJi') -> int:
-        return cls._get_cached().index(ganji)
+        """간지의 60갑자 인덱스 찾기"""
+        index = cls._get_cached_index_by_name().get(ganji.two_letters)
+        if index is None:
+            raise ValueError(f"60갑자에 없는 간지입니다: {ganji.two_letters}")
+        return index
 
     @classmethod
     def find_by_name(cls, *args: Union[str, TenStems, TwelveBranches]) -> 'GanJi':
@@ -464,6 +460,10 @@ class GanJi:
         if len(args) == 1:
             # find_by_name(text: String)
             ganji_text = args[0]
+            if isinstance(ganji_text, str):
+                ganji = cls._get_cached_by_name().get(ganji_text)
+                if ganji is not None:
+                    return ganji
             if len(ganji_text) == 2:
                 return cls.find_by_name(ganji_text[0], ganji_text[1])
             raise ValueError(f"간지 이름은 2글자여야 합니다: {ganji_text}")
@@ -476,10 +476,9 @@ class GanJi:
             elif isinstance(args[0], TenStems) and isinstance(args[1], TwelveBranches):
                 # find_by_name(천간: 천간, 지지: 지지)
                 target_stem, target_branch = args
-                cached_ganji_list = cls._get_cached()
-                for ganji in cached_ganji_list:
-                    if ganji.stem == target_stem and ganji.branch == target_branch:
-                        return ganji
+                ganji = cls._get_cached_by_name().get(target_stem.korean_name + target_branch.korean_name)
+                if ganji is not None:
+                    return ganji
                 raise ValueError(f"간지를 찾을 수 없습니다: {target_stem.korean_name}{target_branch.korean_name}")
         raise ValueError("Invalid arguments for find_by_name()")
 
@@ -495,6 +494,9 @@ class GanJi:
 class Saju:
     """사주 (Four Pillars)"""
 
+    # 일주 기준일: 1925년 2월 9일(갑자일)의 서수(ordinal)
+    _DAY_PILLAR_REFERENCE_ORDINAL = date(1925, 2, 9).toordinal()
+
     def __init__(self, yearly: GanJi, monthly: GanJi, daily: GanJi, hourly: GanJi):
         self.yearly = yearly
         self.monthly = monthly
@@ -589,8 +591,12 @@ class Saju:
 
         1925년 2월 9일(갑자일)을 기준으로 경과 일수를 60갑자로 변환
         """
-        reference_date_1925 = date(1925, 2, 9)  # 갑자일
-        days_from_reference = (birth_date - reference_date_1925).days
+        return Saju._calculate_day_pillar_from_ordinal(birth_date.toordinal())
+
+    @staticmethod
+    def _calculate_day_pillar_from_ordinal(ordinal: int) -> GanJi:
+        """서수(date.toordinal())로 일주 계산 - 연속된 날짜를 셀 때 date 객체 생성 없이 사용"""
+        days_from_reference = ordinal - Saju._DAY_PILLAR_REFERENCE_ORDINAL
         return GanJi.find_by_index(days_from_reference)
 
     @staticmethod
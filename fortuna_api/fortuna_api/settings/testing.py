@@ -87,15 +87,15 @@ AWS_STORAGE_BUCKET_NAME = 'test-bucket'
 AWS_S3_ENDPOINT_URL = None
 AWS_S3_REGION_NAME = 'us-east-1'
 
-# Override storage backend to use local filesystem
+# Override storage backend to keep uploaded files in memory
 STORAGES = {
     "default": {
-        "BACKEND": "django.core.files.storage.FileSystemStorage",
+        "BACKEND": "django.core.files.storage.InMemoryStorage",
     },
     "staticfiles": {
         "BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage",
     },
 }
-DEFAULT_FILE_STORAGE = 'django.core.files.storage.FileSystemStorage'
+DEFAULT_FILE_STORAGE = 'django.core.files.storage.InMemoryStorage'
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'test_media'
\ No newline at end of file